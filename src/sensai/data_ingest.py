@@ -1,18 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Sequence
+from typing import Tuple, Sequence, Union
 
 import numpy as np
 import pandas as pd
-import scipy.stats
+
+from .util.pickle import setstate
 
 
 class InputOutputData:
+    __slots__ = ("inputs", "outputs")
+
     def __init__(self, inputs: pd.DataFrame, outputs: pd.DataFrame):
         if len(inputs) != len(outputs):
             raise ValueError("Lengths do not match")
         self.inputs = inputs
         self.outputs = outputs
 
+    def __setstate__(self, state):
+        setstate(self, state)
+
     def __len__(self):
         return len(self.inputs)
 
@@ -24,21 +30,43 @@ class InputOutputData:
     def outputDim(self):
         return self.outputs.shape[1]
 
-    def filterIndices(self, indices: Sequence[int]) -> 'InputOutputData':
-        inputs = self.inputs.iloc[indices]
-        outputs = self.outputs.iloc[indices]
+    @staticmethod
+    def _takeRows(df: pd.DataFrame, indices: np.ndarray) -> pd.DataFrame:
+        dtypes = set(df.dtypes)
+        if len(dtypes) == 1:
+            dtype = next(iter(dtypes))
+            # for a homogeneous numeric data frame, gathering directly from the underlying array avoids pandas' indexing overhead
+            if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+                return pd.DataFrame(np.take(df.values, indices, axis=0), columns=df.columns, index=df.index[indices])
+        return df.iloc[indices]
+
+    def filterIndices(self, indices: Union[Sequence[int], np.ndarray]) -> 'InputOutputData':
+        """
+        :param indices: the integer positions of the data points to retain
+        :return: a new instance containing only the given data points
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        inputs = self._takeRows(self.inputs, indices)
+        outputs = self._takeRows(self.outputs, indices)
         return InputOutputData(inputs, outputs)
 
     def computeInputOutputCorrelation(self):
-        correlations = {}
-        for outputCol in self.outputs.columns:
-            correlations[outputCol] = {}
-            outputSeries = self.outputs[outputCol]
-            for inputCol in self.inputs.columns:
-                inputSeries = self.inputs[inputCol]
-                pcc, pvalue = scipy.stats.pearsonr(inputSeries, outputSeries)
-                correlations[outputCol][inputCol] = pcc
-        return correlations
+        """
+        Computes the Pearson correlation coefficient between each output column and each input column
+
+        :return: a nested dictionary mapping from output column name to input column name to the correlation coefficient
+        """
+        # centre and normalise all columns at once such that the full correlation matrix is obtained via a single matrix product
+        X = np.array(self.inputs.values, dtype=np.float64)
+        Y = np.array(self.outputs.values, dtype=np.float64)
+        X -= X.mean(axis=0)
+        Y -= Y.mean(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            X /= np.linalg.norm(X, axis=0)
+            Y /= np.linalg.norm(Y, axis=0)
+        C = np.clip(X.T @ Y, -1.0, 1.0)
+        return {outputCol: {inputCol: C[i, j] for i, inputCol in enumerate(self.inputs.columns)}
+            for j, outputCol in enumerate(self.outputs.columns)}
 
 
 class DataSplitter(ABC):
@@ -58,13 +86,12 @@ class DataSplitterFractional(DataSplitter):
     def split(self, data: InputOutputData) -> Tuple[InputOutputData, InputOutputData]:
         numDataPoints = len(data)
         splitIndex = int(numDataPoints * self.fractionalSizeOfFirstSet)
-        rand = np.random.RandomState(self.randomSeed)
         if self.shuffle:
-            indices = rand.permutation(numDataPoints)
+            indices = np.random.default_rng(self.randomSeed).permutation(numDataPoints)
         else:
-            indices = range(numDataPoints)
+            indices = np.arange(numDataPoints)
         indicesA = indices[:splitIndex]
         indicesB = indices[splitIndex:]
-        A = data.filterIndices(list(indicesA))
-        B = data.filterIndices(list(indicesB))
+        A = data.filterIndices(indicesA)
+        B = data.filterIndices(indicesB)
         return A, B
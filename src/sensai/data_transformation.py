@@ -20,6 +20,9 @@ class DataFrameTransformer(ABC):
     (possibly applying the transformation to the original data frame - in-place transformation).
     A data frame transformer may require being fitted using training data.
     """
+    # whether apply always returns a newly allocated data frame, which shares no data with the given data frame (and
+    # applyInplace either returns the given data frame or, likewise, a newly allocated one)
+    returnsNewDataFrame = False
 
     @abstractmethod
     def fit(self, df: pd.DataFrame):
@@ -29,6 +32,18 @@ class DataFrameTransformer(ABC):
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         pass
 
+    def applyInplace(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the transformation, where the given data frame may be modified (instead of being copied) if the transformer
+        supports it. This is used by DataFrameTransformerChain for intermediate results which were newly allocated by the
+        preceding transformer (see returnsNewDataFrame) and are therefore not referenced elsewhere.
+        Subclasses which make a defensive copy in apply should override this method such that the copy is omitted.
+
+        :param df: the data frame, which may be modified
+        :return: the transformed data frame
+        """
+        return self.apply(df)
+
 
 class InvertibleDataFrameTransformer(DataFrameTransformer, ABC):
     @abstractmethod
@@ -58,10 +73,16 @@ class DataFrameTransformerChain:
         :param fit: whether to fit the transformers before applying them
         :return: the transformed data frame
         """
+        isNewDataFrame = False
         for transformer in self.dataFrameTransformers:
             if fit:
                 transformer.fit(df)
-            df = transformer.apply(df)
+            if isNewDataFrame:
+                # the data frame was allocated by the preceding transformer and is not referenced elsewhere, so it need not be copied
+                df = transformer.applyInplace(df)
+            else:
+                df = transformer.apply(df)
+            isNewDataFrame = transformer.returnsNewDataFrame
         return df
 
     def fit(self, df: pd.DataFrame):
@@ -215,8 +236,7 @@ class DFTOneHotEncoder(DataFrameTransformer):
         if len(self._columnsToEncode) == 0:
             return df
 
-        if not self.inplace:
-            df = df.copy()
+        # no copy is required (regardless of self.inplace), because dropping a column creates a new data frame
         for columnName in self._columnsToEncode:
             encodedArray = self.oneHotEncoders[columnName].transform(df[[columnName]])
             df = df.drop(columns=columnName)
@@ -235,7 +255,9 @@ class DFTColumnFilter(RuleBasedDataFrameTransformer):
         self.drop = drop
 
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+        if self.keep is None and self.drop is None:
+            return df.copy()
+        # selecting and dropping columns both create new data frames, so no explicit copy is required
         if self.keep is not None:
             df = df[self.keep]
         if self.drop is not None:
@@ -381,9 +403,16 @@ class DFTNormalisation(DataFrameTransformer):
             if len(unhandledColumns) > 0:
                 raise Exception(f"The following columns are not handled by any rules: {unhandledColumns}")
 
+    @property
+    def returnsNewDataFrame(self) -> bool:
+        return not self.inplace
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if not self.inplace:
             df = df.copy()
+        return self.applyInplace(df)
+
+    def applyInplace(self, df: pd.DataFrame) -> pd.DataFrame:
         matchedRulesByColumn = {}
         for rule in self._rules:
             for c in rule.matchingColumns(df.columns):
@@ -399,9 +428,16 @@ class DFTFromColumnGenerators(RuleBasedDataFrameTransformer):
         self.columnGenerators = columnGenerators
         self.inplace = inplace
 
+    @property
+    def returnsNewDataFrame(self) -> bool:
+        return not self.inplace
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         if not self.inplace:
             df = df.copy()
+        return self.applyInplace(df)
+
+    def applyInplace(self, df: pd.DataFrame) -> pd.DataFrame:
         for cg in self.columnGenerators:
             series = cg.generateColumn(df)
             df[series.name] = series
@@ -453,8 +489,12 @@ class DFTSkLearnTransformer(InvertibleDataFrameTransformer):
             cols = df.columns
         self.sklearnTransformer.fit(df[cols].values)
 
-    def _apply(self, df: pd.DataFrame, inverse: bool) -> pd.DataFrame:
-        if not self.inplace:
+    @property
+    def returnsNewDataFrame(self) -> bool:
+        return not self.inplace
+
+    def _apply(self, df: pd.DataFrame, inverse: bool, inplace: bool) -> pd.DataFrame:
+        if not inplace:
             df = df.copy()
         cols = self.columns
         if cols is None:
@@ -466,10 +506,13 @@ class DFTSkLearnTransformer(InvertibleDataFrameTransformer):
         return df
 
     def apply(self, df):
-        return self._apply(df, False)
+        return self._apply(df, False, self.inplace)
+
+    def applyInplace(self, df):
+        return self._apply(df, False, True)
 
     def applyInverse(self, df):
-        return self._apply(df, True)
+        return self._apply(df, True, self.inplace)
 
 
 class DFTSortColumns(RuleBasedDataFrameTransformer):
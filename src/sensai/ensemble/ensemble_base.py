@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 from concurrent.futures.process import ProcessPoolExecutor
 from typing import Sequence, List
@@ -38,6 +39,16 @@ class EnsembleVectorModel(VectorModel, ABC):
         for i, fittedModelFuture in enumerate(fittedModelFutures):
             self.models[i] = fitters[i].fitEnd(fittedModelFuture.result())
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        # unfitted shallow copies suffice, because clone subsequently deep-copies the entire ensemble
+        models = []
+        for model in self.models:
+            model = copy.copy(model)
+            model._clearFittedState()
+            models.append(model)
+        self.models = models
+
     def computeAllPredictions(self, X: pd.DataFrame):
         if self.numProcesses == 1 or len(self.models) == 1:
             return [model.predict(X) for model in self.models]
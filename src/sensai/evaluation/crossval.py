@@ -1,8 +1,9 @@
-import copy
 import logging
 import warnings
 from abc import ABC, abstractmethod
-from typing import Tuple, Any, Generator, Generic, TypeVar, List
+from concurrent.futures import wait, FIRST_COMPLETED
+from concurrent.futures.process import ProcessPoolExecutor
+from typing import Tuple, Any, Generator, Generic, TypeVar, List, Iterable
 
 import numpy as np
 
@@ -11,8 +12,9 @@ from .eval_stats.eval_stats_classification import ClassificationEvalStats, Class
 from .eval_stats.eval_stats_regression import RegressionEvalStats, RegressionEvalStatsCollection
 from .evaluator import VectorRegressionModelEvaluationData, VectorClassificationModelEvaluationData, \
     PredictorModelEvaluationData, VectorClassificationModelEvaluator, VectorRegressionModelEvaluator, \
-    MetricsDictProvider
+    MetricsDictProvider, VectorModelEvaluator
 from ..data_ingest import InputOutputData
+from ..data_transformation import DataFrameTransformerChain
 from ..util.typing import PandasNamedTuple
 from ..vector_model import VectorClassificationModel, VectorRegressionModel, VectorModel, PredictorModel
 
@@ -64,51 +66,127 @@ class PredictorModelCrossValidationData(ABC, Generic[TModel, TEvalData, TEvalSta
 TCrossValData = TypeVar("TCrossValData", bound=PredictorModelCrossValidationData)
 
 
+def _fitAndEvalModel(evaluator: VectorModelEvaluator, model: VectorModel) -> Tuple[VectorModel, PredictorModelEvaluationData, Any]:
+    """
+    Fits the given model using the evaluator's training data and evaluates it (module-level function such that it can be
+    submitted to a process pool)
+
+    :return: a triple (fitted model, evaluation data, index of the test data)
+    """
+    evaluator.fitModel(model)
+    return model, evaluator.evalModel(model), evaluator.testData.outputs.index
+
+
 class VectorModelCrossValidator(MetricsDictProvider, Generic[TCrossValData], ABC):
-    def __init__(self, data: InputOutputData, folds: int = 5, randomSeed=42, returnTrainedModels=False, evaluatorParams: dict = None):
+    def __init__(self, data: InputOutputData, folds: int = 5, randomSeed=42, returnTrainedModels=False, evaluatorParams: dict = None,
+            numProcesses=1, applyRuleBasedInputTransformersOnce=False):
         """
         :param data: the data set
         :param folds: the number of folds
         :param randomSeed: the random seed to use
-        :param returnTrainedModels: whether to create a copy of the model for each fold and return each of the models
-            (requires that models can be deep-copied); if False, the model that is passed to evalModel is fitted several times
+        :param returnTrainedModels: whether to create a copy of the model for each fold (see VectorModel.clone) and return each of
+            the models; if False, the model that is passed to evalModel is fitted several times
         :param evaluatorParams: keyword parameters with which to instantiate model evaluators
+        :param numProcesses: the number of processes in which to fit and evaluate the folds in parallel (requires that models
+            and data can be pickled); if greater than 1, each process operates on its own copy of the model, i.e. the model that
+            is passed to evalModel is not fitted. At most numProcesses folds are submitted at a time, such that the data
+            of further folds is only materialised once a process becomes available
+        :param applyRuleBasedInputTransformersOnce: whether to apply the model's rule-based input transformers (see
+            VectorModel.getRuleBasedInputTransformers) to the full data set once rather than in every fold.
+            The transformers must not change the set of rows. Note that the resulting evaluation data will then refer to
+            the transformed inputs.
         """
         self.returnTrainedModels = returnTrainedModels
+        self.numProcesses = numProcesses
+        self.applyRuleBasedInputTransformersOnce = applyRuleBasedInputTransformersOnce
         self.evaluatorParams = evaluatorParams if evaluatorParams is not None else {}
         numDataPoints = len(data)
-        permutedIndices = np.random.RandomState(randomSeed).permutation(numDataPoints)
+        permutedIndices = np.random.default_rng(randomSeed).permutation(numDataPoints)
         numTestPoints = numDataPoints // folds
-        self.modelEvaluators = []
-        for i in range(folds):
-            testStartIdx = i * numTestPoints
-            testEndIdx = testStartIdx + numTestPoints
-            testIndices = permutedIndices[testStartIdx:testEndIdx]
-            trainIndices = np.concatenate((permutedIndices[:testStartIdx], permutedIndices[testEndIdx:]))
-            self.modelEvaluators.append(self._createModelEvaluator(data.filterIndices(trainIndices), data.filterIndices(testIndices)))
+        self._data = data
+        self._permutedIndices = permutedIndices
+        self._testIndexRanges: List[Tuple[int, int]] = [(i * numTestPoints, (i + 1) * numTestPoints) for i in range(folds)]
 
     @abstractmethod
     def _createModelEvaluator(self, trainingData: InputOutputData, testData: InputOutputData):
         pass
 
+    def _iterModelEvaluators(self, data: InputOutputData) -> Generator[VectorModelEvaluator, None, None]:
+        """
+        Creates the evaluators for the individual folds one at a time, such that the training and test data of a fold
+        only need to be materialised while the fold is being processed
+
+        :param data: the full data set (with the same rows as the data set the instance was created with)
+        """
+        for trainIndices, testIndices in self._iterFoldIndices():
+            yield self._createModelEvaluator(data.filterIndices(trainIndices), data.filterIndices(testIndices))
+
+    def _iterFoldIndices(self) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+        """
+        Generates the pairs (training indices, test indices) of the folds, where the training indices are only materialised
+        on demand (the test indices being views on the permuted indices)
+        """
+        for testStartIdx, testEndIdx in self._testIndexRanges:
+            testIndices = self._permutedIndices[testStartIdx:testEndIdx]
+            trainIndices = np.concatenate((self._permutedIndices[:testStartIdx], self._permutedIndices[testEndIdx:]))
+            yield trainIndices, testIndices
+
     @abstractmethod
     def _createResultData(self, trainedModels, evalDataList, testIndicesList, predictedVarNames) -> TCrossValData:
         pass
 
     def evalModel(self, model: VectorModel):
+        ruleBasedTransformers = model.getRuleBasedInputTransformers() if self.applyRuleBasedInputTransformersOnce else []
+        if len(ruleBasedTransformers) == 0:
+            return self._evalModel(model, self._data)
+
+        transformedInputs = DataFrameTransformerChain(ruleBasedTransformers).apply(self._data.inputs.copy())
+        if len(transformedInputs) != len(self._data) or not transformedInputs.index.equals(self._data.inputs.index):
+            log.warning(f"Rule-based input transformers of {model} changed the set of rows; applying them in each fold instead")
+            return self._evalModel(model, self._data)
+
+        # evaluate the model without the rule-based transformers (on the transformed data) and restore them afterwards
+        model.withInputTransformers(model.getInputTransformers()[len(ruleBasedTransformers):])
+        try:
+            result = self._evalModel(model, InputOutputData(transformedInputs, self._data.outputs))
+        finally:
+            model.withInputTransformers(ruleBasedTransformers + model.getInputTransformers())
+        if result.predictorModels is not None:
+            for trainedModel in result.predictorModels:
+                if trainedModel is not model:
+                    trainedModel.withInputTransformers(ruleBasedTransformers + trainedModel.getInputTransformers())
+        return result
+
+    def _evalModel(self, model: VectorModel, data: InputOutputData) -> TCrossValData:
+        if self.numProcesses == 1:
+            results = (_fitAndEvalModel(evaluator, model.clone() if self.returnTrainedModels else model)
+                for evaluator in self._iterModelEvaluators(data))
+            return self._createResultDataFromFoldResults(results)
+        else:
+            with ProcessPoolExecutor(max_workers=self.numProcesses) as executor:
+                futures = []
+                for trainIndices, testIndices in self._iterFoldIndices():
+                    # wait for a fold to complete before creating the next one if all processes are busy
+                    pendingFutures = [future for future in futures if not future.done()]
+                    if len(pendingFutures) >= self.numProcesses:
+                        wait(pendingFutures, return_when=FIRST_COMPLETED)
+                    evaluator = self._createModelEvaluator(data.filterIndices(trainIndices), data.filterIndices(testIndices))
+                    futures.append(executor.submit(_fitAndEvalModel, evaluator, model.clone()))
+                    del evaluator
+                return self._createResultDataFromFoldResults(future.result() for future in futures)
+
+    def _createResultDataFromFoldResults(self, foldResults: Iterable[Tuple[VectorModel, PredictorModelEvaluationData, Any]]) -> TCrossValData:
         trainedModels = [] if self.returnTrainedModels else None
         evalDataList = []
         testIndicesList = []
         predictedVarNames = None
-        for evaluator in self.modelEvaluators:
-            modelToFit: VectorModel = copy.deepcopy(model) if self.returnTrainedModels else model
-            evaluator.fitModel(modelToFit)
+        for modelFitted, evalData, testIndices in foldResults:
             if predictedVarNames is None:
-                predictedVarNames = modelToFit.getPredictedVariableNames()
+                predictedVarNames = modelFitted.getPredictedVariableNames()
             if self.returnTrainedModels:
-                trainedModels.append(modelToFit)
-            evalDataList.append(evaluator.evalModel(modelToFit))
-            testIndicesList.append(evaluator.testData.outputs.index)
+                trainedModels.append(modelFitted)
+            evalDataList.append(evalData)
+            testIndicesList.append(testIndices)
         return self._createResultData(trainedModels, evalDataList, testIndicesList, predictedVarNames)
 
     def computeMetrics(self, model: VectorModel):
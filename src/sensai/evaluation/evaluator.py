@@ -3,12 +3,14 @@ import time
 from abc import ABC, abstractmethod
 from typing import Tuple, Dict, Any, Generator, Generic, TypeVar, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .eval_stats.eval_stats_base import EvalStats, EvalStatsCollection
 from .eval_stats.eval_stats_classification import ClassificationEvalStats, ClassificationMetric
 from .eval_stats.eval_stats_regression import RegressionEvalStats, RegressionEvalStatsCollection, RegressionMetric
 from ..data_ingest import DataSplitter, DataSplitterFractional, InputOutputData
+from ..util.pickle import setstate
 from ..util.typing import PandasNamedTuple
 from ..vector_model import VectorClassificationModel, VectorModel, PredictorModel
 
@@ -26,6 +28,8 @@ class MetricsDictProvider(ABC):
 
 
 class PredictorModelEvaluationData(ABC, Generic[TEvalStats]):
+    __slots__ = ("inputData", "evalStatsByVarName", "predictedVarNames", "modelName")
+
     def __init__(self, statsDict: Dict[str, TEvalStats], inputData: pd.DataFrame, model: PredictorModel):
         """
         :param statsDict: a dictionary mapping from output variable name to the evaluation statistics object
@@ -37,6 +41,9 @@ class PredictorModelEvaluationData(ABC, Generic[TEvalStats]):
         self.predictedVarNames = list(self.evalStatsByVarName.keys())
         self.modelName = model.getName()
 
+    def __setstate__(self, state):
+        setstate(self, state)
+
     def getEvalStats(self, predictedVarName=None) -> TEvalStats:
         if predictedVarName is None:
             if len(self.evalStatsByVarName) != 1:
@@ -54,12 +61,12 @@ class PredictorModelEvaluationData(ABC, Generic[TEvalStats]):
 
         :return: a DataFrame containing evaluation metrics
         """
-        statsDicts = []
-        varNames = []
-        for predictedVarName, evalStats in self.evalStatsByVarName.items():
-            statsDicts.append(evalStats.getAll())
-            varNames.append(predictedVarName)
-        df = pd.DataFrame(statsDicts, index=varNames)
+        varNames = list(self.evalStatsByVarName.keys())
+        statsDicts = [evalStats.getAll() for evalStats in self.evalStatsByVarName.values()]
+        # the output variables' sets of metrics may differ, so values are aligned by metric name (in order of first occurrence)
+        metricNames = dict.fromkeys(metricName for statsDict in statsDicts for metricName in statsDict)
+        metricValues = {metricName: [statsDict.get(metricName, np.nan) for statsDict in statsDicts] for metricName in metricNames}
+        df = pd.DataFrame(metricValues, index=varNames)
         df.index.name = "predictedVar"
         return df
 
@@ -70,6 +77,8 @@ class PredictorModelEvaluationData(ABC, Generic[TEvalStats]):
 
 
 class VectorRegressionModelEvaluationData(PredictorModelEvaluationData[RegressionEvalStats]):
+    __slots__ = ()
+
     def getEvalStatsCollection(self):
         return RegressionEvalStatsCollection(list(self.evalStatsByVarName.values()))
 
@@ -125,6 +134,11 @@ class VectorModelEvaluator(MetricsDictProvider, ABC):
 class VectorRegressionModelEvaluator(VectorModelEvaluator):
     def __init__(self, data: InputOutputData, testData: InputOutputData = None, dataSplitter=None, testFraction=None, randomSeed=42, shuffle=True,
             additionalMetrics: Sequence[RegressionMetric] = None):
+        """
+        See VectorModelEvaluator for the data-related parameters.
+
+        :param additionalMetrics: the metrics to compute in addition to the default metrics of RegressionEvalStats
+        """
         super().__init__(data=data, dataSplitter=dataSplitter, testFraction=testFraction, testData=testData, randomSeed=randomSeed, shuffle=shuffle)
         self.additionalMetrics = additionalMetrics
 
@@ -134,8 +148,14 @@ class VectorRegressionModelEvaluator(VectorModelEvaluator):
         evalStatsByVarName = {}
         inputOutputData = self.trainingData if onTrainingData else self.testData
         predictions, groundTruth = self._computeOutputs(model, inputOutputData)
+        # extract the columns from the underlying arrays rather than constructing a Series for each output variable
+        predictionsArray = predictions.values
+        groundTruthArray = groundTruth.values
+        predictionsColumnIndices = {col: i for i, col in enumerate(predictions.columns)}
+        groundTruthColumnIndices = {col: i for i, col in enumerate(groundTruth.columns)}
         for predictedVarName in model.getPredictedVariableNames():
-            evalStats = RegressionEvalStats(y_predicted=predictions[predictedVarName], y_true=groundTruth[predictedVarName],
+            evalStats = RegressionEvalStats(y_predicted=predictionsArray[:, predictionsColumnIndices[predictedVarName]],
+                y_true=groundTruthArray[:, groundTruthColumnIndices[predictedVarName]],
                 additionalMetrics=self.additionalMetrics)
             evalStatsByVarName[predictedVarName] = evalStats
         return VectorRegressionModelEvaluationData(evalStatsByVarName, inputOutputData.inputs, model)
@@ -163,7 +183,7 @@ class VectorRegressionModelEvaluator(VectorModelEvaluator):
 
 
 class VectorClassificationModelEvaluationData(PredictorModelEvaluationData[ClassificationEvalStats]):
-    pass
+    __slots__ = ()
 
 
 class VectorClassificationModelEvaluator(VectorModelEvaluator):
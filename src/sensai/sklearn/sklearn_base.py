@@ -1,11 +1,14 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn import compose
+from sklearn import compose, linear_model, svm
+from sklearn.preprocessing import StandardScaler, MinMaxScaler, MaxAbsScaler
 
+from ..data_transformation import DFTSkLearnTransformer
 from ..vector_model import VectorRegressionModel, VectorClassificationModel
 
 _log = logging.getLogger(__name__)
@@ -18,6 +21,36 @@ def createSkLearnModel(modelConstructor, modelArgs, outputTransformer=None):
     return model
 
 
+def _affineTransformationParams(sklearnTransformer) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    :param sklearnTransformer: a fitted transformer from sklearn.preprocessing
+    :return: a pair (scale, offset) such that the transformer maps x to x * scale + offset or None if the transformer is not
+        a (supported) affine transformation
+    """
+    if type(sklearnTransformer) == StandardScaler:
+        scale = 1 / sklearnTransformer.scale_ if sklearnTransformer.with_std else 1.0
+        offset = -sklearnTransformer.mean_ * scale if sklearnTransformer.with_mean else 0.0
+        return scale, offset
+    elif type(sklearnTransformer) == MinMaxScaler:
+        if getattr(sklearnTransformer, "clip", False):  # clipping to the feature range is not affine
+            return None
+        return sklearnTransformer.scale_, sklearnTransformer.min_
+    elif type(sklearnTransformer) == MaxAbsScaler:
+        return 1 / sklearnTransformer.scale_, 0.0
+    return None
+
+
+# estimator types whose predict method computes exactly X @ coef_.T + intercept_
+_LINEAR_ESTIMATOR_TYPES = (linear_model.LinearRegression, linear_model.Ridge, linear_model.Lasso, linear_model.ElasticNet,
+    linear_model.SGDRegressor, svm.LinearSVR)
+
+
+def _isLinearEstimator(estimator) -> bool:
+    if type(estimator) in _LINEAR_ESTIMATOR_TYPES:
+        return True
+    return type(estimator) == svm.SVR and estimator.kernel == "linear"
+
+
 class AbstractSkLearnVectorRegressionModel(VectorRegressionModel, ABC):
     """
     Base class for models built upon scikit-learn's model implementations
@@ -117,11 +150,15 @@ class AbstractSkLearnMultipleOneDimVectorRegressionModel(AbstractSkLearnVectorRe
             model.fit(inputs, outputs[predictedVarName])
             self.models[predictedVarName] = model
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.models = {}
+
     def _predictSkLearn(self, inputs: pd.DataFrame) -> pd.DataFrame:
         results = {}
         for varName in self.models:
             results[varName] = self.models[varName].predict(inputs)
-        return pd.DataFrame(results)
+        return pd.DataFrame(results, index=inputs.index)
 
 
 class AbstractSkLearnMultiDimVectorRegressionModel(AbstractSkLearnVectorRegressionModel, ABC):
@@ -148,9 +185,46 @@ class AbstractSkLearnMultiDimVectorRegressionModel(AbstractSkLearnVectorRegressi
             outputValues = np.ravel(outputValues)
         self.model.fit(inputs, outputValues)
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.model = None
+
+    def _compileSpecialized(self):
+        # supported: a linear model, where all input transformations are affine scalings of all columns (which can be folded into
+        # the model's weights) and no transformations are applied to the outputs
+        if not _isLinearEstimator(self.model) or self._featureGenerator is not None or self._targetTransformer is not None \
+                or len(self._outputTransformerChain.dataFrameTransformers) > 0:
+            return None
+        coef = self.model.coef_
+        intercept = self.model.intercept_
+        sklearnTransformers = []
+        for transformer in self._inputTransformerChain.dataFrameTransformers:
+            if type(transformer) != DFTSkLearnTransformer or transformer.columns is not None:
+                return None
+            sklearnTransformers.append(transformer.sklearnTransformer)
+        if self.sklearnInputTransformer is not None:
+            sklearnTransformers.append(self.sklearnInputTransformer)
+        numInputs = len(self._modelInputVariableNames)
+        scale = np.ones(numInputs)
+        offset = np.zeros(numInputs)
+        for sklearnTransformer in sklearnTransformers:
+            params = _affineTransformationParams(sklearnTransformer)
+            if params is None:
+                return None
+            s, o = params
+            scale, offset = scale * s, offset * s + o
+        W = np.reshape(coef, (-1, numInputs))  # (outputs, inputs)
+        weights = (W * scale).T
+        bias = offset @ W.T + intercept
+
+        def predictLinear(X: np.ndarray) -> np.ndarray:
+            return X @ weights + bias
+
+        return predictLinear
+
     def _predictSkLearn(self, inputs: pd.DataFrame) -> pd.DataFrame:
         Y = self.model.predict(inputs)
-        return pd.DataFrame(Y, columns=self.getModelOutputVariableNames())
+        return pd.DataFrame(Y, columns=self.getModelOutputVariableNames(), index=inputs.index)
 
 
 class AbstractSkLearnVectorClassificationModel(VectorClassificationModel, ABC):
@@ -205,6 +279,10 @@ class AbstractSkLearnVectorClassificationModel(VectorClassificationModel, ABC):
         _log.info(f"Fitting sklearn classifier of type {self.model.__class__.__name__}")
         self.model.fit(inputValues, np.ravel(outputs.values))
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.model = None
+
     def _transformInput(self, inputs: pd.DataFrame, fit=False) -> np.ndarray:
         inputValues = inputs.values
         if self.sklearnInputTransformer is not None:
@@ -217,12 +295,12 @@ class AbstractSkLearnVectorClassificationModel(VectorClassificationModel, ABC):
     def _predict(self, x: pd.DataFrame):
         inputValues = self._transformInput(x)
         Y = self.model.predict(inputValues)
-        return pd.DataFrame(Y, columns=self._predictedVariableNames)
+        return pd.DataFrame(Y, columns=self._predictedVariableNames, index=x.index)
 
     def _predictClassProbabilities(self, x: pd.DataFrame):
         inputValues = self._transformInput(x)
         Y = self.model.predict_proba(inputValues)
-        return pd.DataFrame(Y, columns=self._labels)
+        return pd.DataFrame(Y, columns=self._labels, index=x.index)
 
     def get_params(self, deep=True):
         return self.model.get_params(deep=deep)
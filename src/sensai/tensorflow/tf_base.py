@@ -117,6 +117,13 @@ class KerasVectorRegressionModel(VectorRegressionModel, ABC):
             os.unlink(tempFilePath)
         self.model = model
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.model = None
+        self.inputScaler = None
+        self.outputScaler = None
+        self.trainingHistory = None
+
     def _predict(self, inputs: pd.DataFrame) -> pd.DataFrame:
         X = self.inputScaler.getNormalisedArray(inputs)
         Y = self.model.predict(X)
@@ -257,6 +257,10 @@ class TorchVectorRegressionModel(VectorRegressionModel):
     def _createTorchModel(self) -> TorchModel:
         return self.modelClass(*self.modelArgs, **self.modelKwArgs)
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.model = None
+
     def _createDataSetProvider(self, inputs: pd.DataFrame, outputs: pd.DataFrame) -> TorchDataSetProvider:
         dataUtil = VectorDataUtil(inputs, outputs, self.model.cuda, normalisationMode=self.normalisationMode)
         return TorchDataSetProviderFromDataUtil(dataUtil, self.model.cuda)
@@ -315,6 +319,10 @@ class TorchVectorClassificationModel(VectorClassificationModel):
     def _createTorchModel(self) -> VectorTorchModel:
         return self.modelClass(*self.modelArgs, **self.modelKwArgs)
 
+    def _clearFittedState(self):
+        super()._clearFittedState()
+        self.model = None
+
     def _createDataSetProvider(self, inputs: pd.DataFrame, outputs: pd.DataFrame) -> TorchDataSetProvider:
         dataUtil = ClassificationVectorDataUtil(inputs, outputs, self.model.cuda, len(self._labels),
             normalisationMode=self.normalisationMode)
@@ -1,10 +1,26 @@
 import logging
 import pickle
-from typing import List
+from typing import List, Any
 
 log = logging.getLogger(__name__)
 
 
+def setstate(obj, state: Any):
+    """
+    Restores the state of an object whose class defines __slots__ (for use in __setstate__), supporting both the state
+    pickled for slotted instances, i.e. a pair (dict or None, slots dict), and a plain dictionary, as pickled by versions
+    of the class which did not yet define __slots__
+
+    :param obj: the object whose state to restore
+    :param state: the unpickled state
+    """
+    if isinstance(state, tuple):
+        dictState, slotsState = state
+        state = {**(dictState or {}), **(slotsState or {})}
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
 class PickleFailureDebugger:
     """
     A collection of methods for testing whether objects can be pickled and logging useful infos in case they cannot
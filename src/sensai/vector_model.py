@@ -1,11 +1,13 @@
+import copy
 import logging
 from abc import ABC, abstractmethod
-from typing import Sequence, List, Any, Optional, Union, TypeVar
+from typing import Sequence, List, Any, Optional, Union, TypeVar, Callable
 
 import numpy as np
 import pandas as pd
 
-from .data_transformation import DataFrameTransformer, DataFrameTransformerChain, InvertibleDataFrameTransformer
+from .data_transformation import DataFrameTransformer, DataFrameTransformerChain, InvertibleDataFrameTransformer, \
+    RuleBasedDataFrameTransformer
 from .featuregen import FeatureGenerator, FeatureCollector
 from .util.cache import PickleLoadSaveMixin
 
@@ -52,6 +54,8 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
         self._outputTransformerChain = DataFrameTransformerChain(())
         self._predictedVariableNames = None
         self._modelInputVariableNames = None
+        self._modelInputVariableNamesTuple = None
+        self._modelInputColumns = None
         self._modelOutputVariableNames = None
         self._targetTransformer = None
         self._name = None
@@ -140,6 +144,25 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
     def isFitted(self):
         return self._isFitted
 
+    def clone(self) -> __qualname__:
+        """
+        Creates an unfitted copy of this model, which uses the same parameters, feature generator and transformers.
+        In contrast to a full deep copy, the state that results from fitting the model (see _clearFittedState) is not copied.
+
+        :return: the copy
+        """
+        model = copy.copy(self)
+        model._clearFittedState()
+        return copy.deepcopy(model)
+
+    def _clearFittedState(self):
+        """
+        Resets the state that results from fitting the model (without affecting any other references to the state).
+        It is applied to a shallow copy of the model in clone, and subclasses that store (potentially large) fitted state
+        should override it in order to reset the respective attributes.
+        """
+        self._isFitted = False
+
     def _computeInputs(self, x: pd.DataFrame, y=None) -> pd.DataFrame:
         fit = y is not None
         if self._featureGenerator is not None:
@@ -151,10 +174,21 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
         if not fit:
             if not self.isFitted():
                 raise Exception(f"Model has not been fitted")
-            if self.checkInputColumns and list(x.columns) != self._modelInputVariableNames:
+            if self.checkInputColumns and not self._hasModelInputColumns(x):
                 raise Exception(f"Inadmissible input data frame: expected columns {self._modelInputVariableNames}, got {list(x.columns)}")
         return x
 
+    def _hasModelInputColumns(self, x: pd.DataFrame) -> bool:
+        # data frames derived from the same source typically share the (immutable) columns index, so check identity first.
+        # The attributes are read via getattr, as they are missing in models that were pickled by earlier versions.
+        modelInputColumns = getattr(self, "_modelInputColumns", None)
+        if modelInputColumns is not None and x.columns is modelInputColumns:
+            return True
+        namesTuple = getattr(self, "_modelInputVariableNamesTuple", None)
+        if namesTuple is None:
+            namesTuple = self._modelInputVariableNamesTuple = tuple(self._modelInputVariableNames)
+        return tuple(x.columns) == namesTuple
+
     def predict(self, x: pd.DataFrame) -> pd.DataFrame:
         """
         Performs a prediction for the given input data frame
@@ -164,7 +198,8 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
         """
         x = self._computeInputs(x)
         y = self._predict(x)
-        y.index = x.index
+        if y.index is not x.index:
+            y.index = x.index
         y = self._outputTransformerChain.apply(y)
         if self._targetTransformer is not None:
             y = self._targetTransformer.applyInverse(y)
@@ -172,6 +207,11 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
 
     @abstractmethod
     def _predict(self, x: pd.DataFrame) -> pd.DataFrame:
+        """
+        :param x: the input data (after feature generation and input transformation)
+        :return: a data frame with the predictions, which should use the index of x (if it does not, x's index is applied
+            subsequently, which requires the rows to be in the same order)
+        """
         pass
 
     def fit(self, X: pd.DataFrame, Y: pd.DataFrame):
@@ -188,6 +228,8 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
             self._targetTransformer.fit(Y)
             Y = self._targetTransformer.apply(Y)
         self._modelInputVariableNames = list(X.columns)
+        self._modelInputVariableNamesTuple = tuple(self._modelInputVariableNames)
+        self._modelInputColumns = X.columns
         self._modelOutputVariableNames = list(Y.columns)
         log.info(f"Training with outputs[{len(self._modelOutputVariableNames)}]={self._modelOutputVariableNames}, inputs[{len(self._modelInputVariableNames)}]=[{', '.join([n + '/' + X[n].dtype.name for n in self._modelInputVariableNames])}]")
         self._fit(X, Y)
@@ -197,6 +239,41 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
     def _fit(self, X: pd.DataFrame, Y: pd.DataFrame):
         pass
 
+    def compileSpecialized(self, inputColumns: Optional[Sequence[str]] = None) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Creates a function which maps an array of input data points (one row per data point) to an array of predictions (one column
+        per predicted variable, see getPredictedVariableNames), which is intended for repeated inference on small batches.
+        If the model's entire pipeline (feature generation, transformations and the model itself) is known to be equivalent to a
+        closed-form numerical computation, a specialised function which performs only this computation is returned.
+        Otherwise, the returned function constructs a data frame and applies predict.
+
+        :param inputColumns: the names of the columns (in the order in which they appear in the arrays) to use for the construction of
+            input data frames in the non-specialised case; if None, use the model's input variable names (which is appropriate only if
+            there is no feature generator and the input transformers do not change the columns).
+            A specialised function always expects inputs with columns corresponding to the model's input variable names.
+        :return: the function
+        """
+        if not self.isFitted():
+            raise Exception(f"Model has not been fitted")
+        fn = self._compileSpecialized()
+        if fn is not None:
+            log.info(f"Compiled specialised prediction function for {self}")
+            return fn
+        columns = list(inputColumns) if inputColumns is not None else self._modelInputVariableNames
+
+        def predictArray(X: np.ndarray) -> np.ndarray:
+            return self.predict(pd.DataFrame(X, columns=columns)).values
+
+        return predictArray
+
+    def _compileSpecialized(self) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """
+        Designed to be overridden by models which can provide a specialised prediction function (see compileSpecialized)
+
+        :return: the specialised function or None if the model's pipeline cannot be specialised
+        """
+        return None
+
     def getPredictedVariableNames(self):
         return self._predictedVariableNames
 
@@ -217,6 +294,25 @@ class VectorModel(PredictorModel, PickleLoadSaveMixin, ABC):
                 return it
         return None
 
+    def getInputTransformers(self) -> List[DataFrameTransformer]:
+        return list(self._inputTransformerChain.dataFrameTransformers)
+
+    def getRuleBasedInputTransformers(self) -> List[RuleBasedDataFrameTransformer]:
+        """
+        Gets the rule-based transformers at the beginning of the input transformer chain, provided that the model does not use a
+        feature generator, i.e. the transformers which are applied directly to the data that is passed to fit/predict and whose
+        results therefore do not depend on the training data
+
+        :return: the (possibly empty) list of transformers
+        """
+        result = []
+        if self._featureGenerator is None:
+            for transformer in self._inputTransformerChain.dataFrameTransformers:
+                if not isinstance(transformer, RuleBasedDataFrameTransformer):
+                    break
+                result.append(transformer)
+        return result
+
     def setName(self, name):
         self._name = name
 
@@ -256,7 +352,8 @@ class VectorClassificationModel(VectorModel, ABC):
     def _fit(self, X: pd.DataFrame, Y: pd.DataFrame):
         if len(Y.columns) != 1:
             raise ValueError("Classification requires exactly one output column with class labels")
-        self._labels = sorted([label for label in Y.iloc[:, 0].unique()])
+        # labels must be sorted in order to be consistent with the classes of the underlying models (e.g. sklearn's classes_)
+        self._labels = sorted(Y.iloc[:, 0].unique())
         self._fitClassifier(X, Y)
 
     def getClassLabels(self) -> List[Any]:
@@ -271,7 +368,7 @@ class VectorClassificationModel(VectorModel, ABC):
         Converts from a result returned by predictClassProbabilities to a result as return by predict
 
         :param df: the output data frame from predictClassProbabilities
-        :return: an output data frame as it would be returned by predict
+        :return: an output data frame as it would be returned by predict (with the same index as df)
         """
         dfCols = list(df.columns)
         if dfCols != self._labels:
@@ -279,7 +376,7 @@ class VectorClassificationModel(VectorModel, ABC):
         yArray = df.values
         maxIndices = np.argmax(yArray, axis=1)
         result = [self._labels[i] for i in maxIndices]
-        return pd.DataFrame(result, columns=self.getModelOutputVariableNames())
+        return pd.DataFrame(result, columns=self.getModelOutputVariableNames(), index=df.index)
 
     def predictClassProbabilities(self, x: pd.DataFrame) -> pd.DataFrame:
         """
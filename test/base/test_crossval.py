@@ -0,0 +1,80 @@
+from concurrent.futures.process import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+import sensai
+import sensai.evaluation.crossval
+from sensai import InputOutputData
+from sensai.data_transformation import DFTModifyColumnVectorized, DFTSkLearnTransformer
+from sensai.evaluation import VectorClassificationModelCrossValidator, VectorRegressionModelCrossValidator
+
+
+def test_classificationCrossValidation(irisDataSet):
+    data = irisDataSet.getInputOutputData()
+    crossValidator = VectorClassificationModelCrossValidator(data, folds=3, returnTrainedModels=True)
+    model = sensai.sklearn.classification.SkLearnRandomForestVectorClassificationModel()
+    result = crossValidator.evalModel(model)
+    assert len(result.evalDataList) == 3
+    assert len(result.predictorModels) == 3
+    testIndices = np.concatenate([np.array(idx) for idx in result.testIndicesList])
+    assert len(np.unique(testIndices)) == len(testIndices) == len(data)
+    assert result.getEvalStatsCollection().aggStats()["mean[ACC]"] >= 0.9
+
+
+def test_classificationCrossValidationParallel(irisDataSet):
+    data = irisDataSet.getInputOutputData()
+    model = sensai.sklearn.classification.SkLearnRandomForestVectorClassificationModel(random_state=42)
+    sequentialResult = VectorClassificationModelCrossValidator(data, folds=3).evalModel(model)
+    parallelResult = VectorClassificationModelCrossValidator(data, folds=3, numProcesses=2).evalModel(model)
+    assert sequentialResult.getEvalStatsCollection().aggStats() == parallelResult.getEvalStatsCollection().aggStats()
+
+
+def test_crossValidationParallelLimitsFoldsInFlight(irisDataSet, monkeypatch):
+    futures = []
+
+    class ProcessPoolExecutorRecordingFutures(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            futures.append(future)
+            return future
+
+    numFoldsInFlight = []
+
+    class CrossValidatorRecordingFoldsInFlight(VectorClassificationModelCrossValidator):
+        def _createModelEvaluator(self, trainingData, testData):
+            numFoldsInFlight.append(sum(not future.done() for future in futures))
+            return super()._createModelEvaluator(trainingData, testData)
+
+    monkeypatch.setattr(sensai.evaluation.crossval, "ProcessPoolExecutor", ProcessPoolExecutorRecordingFutures)
+    model = sensai.sklearn.classification.SkLearnRandomForestVectorClassificationModel(n_estimators=5)
+    result = CrossValidatorRecordingFoldsInFlight(irisDataSet.getInputOutputData(), folds=5, numProcesses=2).evalModel(model)
+    assert len(result.evalDataList) == len(numFoldsInFlight) == 5
+    # a fold's data is only created once fewer than numProcesses folds are being processed
+    assert max(numFoldsInFlight) < 2
+
+
+def test_regressionCrossValidationApplyRuleBasedInputTransformersOnce():
+    rand = np.random.RandomState(42)
+    inputs = pd.DataFrame(rand.randn(60, 2), columns=["a", "b"])
+    outputs = pd.DataFrame({"y": np.exp(inputs["a"]) - inputs["b"]})
+    data = InputOutputData(inputs, outputs)
+
+    def createModel():
+        return sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel() \
+            .withInputTransformers(DFTModifyColumnVectorized("a", np.exp), DFTSkLearnTransformer(StandardScaler()))
+
+    results = []
+    for applyOnce in (False, True):
+        crossValidator = VectorRegressionModelCrossValidator(data, folds=3, returnTrainedModels=True,
+            applyRuleBasedInputTransformersOnce=applyOnce)
+        model = createModel()
+        result = crossValidator.evalModel(model)
+        assert len(model.getInputTransformers()) == 2
+        for trainedModel in result.predictorModels:
+            assert len(trainedModel.getInputTransformers()) == 2
+            assert trainedModel.predict(inputs.copy())["y"].corr(outputs["y"]) > 0.99
+        results.append(result.getEvalStatsCollection().aggStats())
+    assert results[0] == pytest.approx(results[1])
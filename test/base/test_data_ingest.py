@@ -0,0 +1,38 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import scipy.stats
+
+from sensai import InputOutputData
+
+
+def test_computeInputOutputCorrelation():
+    rand = np.random.RandomState(42)
+    inputs = pd.DataFrame(rand.randn(50, 3), columns=["a", "b", "c"])
+    outputs = pd.DataFrame({"y": inputs["a"] * 2 + rand.randn(50), "z": rand.randn(50)})
+    correlations = InputOutputData(inputs, outputs).computeInputOutputCorrelation()
+    for outputCol in outputs.columns:
+        for inputCol in inputs.columns:
+            pcc, _ = scipy.stats.pearsonr(inputs[inputCol], outputs[outputCol])
+            assert np.isclose(correlations[outputCol][inputCol], pcc)
+
+
+def test_filterIndices():
+    inputs = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "b": [5.0, 6.0, 7.0, 8.0]}, index=[10, 11, 12, 13])
+    outputs = pd.DataFrame({"y": ["p", "q", "r", "s"]}, index=[10, 11, 12, 13])
+    indices = np.array([3, 0])
+    filtered = InputOutputData(inputs, outputs).filterIndices(indices)
+    assert filtered.inputs.equals(inputs.iloc[indices])
+    assert filtered.outputs.equals(outputs.iloc[indices])
+
+
+def test_pickleCompatibility():
+    inputs = pd.DataFrame({"a": [1.0, 2.0]})
+    outputs = pd.DataFrame({"y": [3.0, 4.0]})
+    data = pickle.loads(pickle.dumps(InputOutputData(inputs, outputs)))
+    assert data.inputs.equals(inputs) and data.outputs.equals(outputs)
+    # instances pickled by versions of the class without __slots__ provide their state as a plain dictionary
+    data = InputOutputData.__new__(InputOutputData)
+    data.__setstate__({"inputs": inputs, "outputs": outputs})
+    assert data.inputs is inputs and data.outputs is outputs
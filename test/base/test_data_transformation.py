@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from sensai.columngen import ColumnGenerator
+from sensai.data_transformation import DataFrameTransformerChain, DFTSkLearnTransformer, DFTFromColumnGenerators, \
+    RuleBasedDataFrameTransformer
+
+
+class ColumnGeneratorSum(ColumnGenerator):
+    def __init__(self):
+        super().__init__("sum")
+
+    def _generateColumn(self, df: pd.DataFrame) -> pd.Series:
+        return df["a"] + df["b"]
+
+
+class DFTDropFirstRow(RuleBasedDataFrameTransformer):
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.iloc[1:]  # a view on the given data frame
+
+
+class DFTSkLearnTransformerRecordingInplace(DFTSkLearnTransformer):
+    def __init__(self, sklearnTransformer):
+        super().__init__(sklearnTransformer)
+        self.appliedInplace = False
+
+    def applyInplace(self, df):
+        self.appliedInplace = True
+        return super().applyInplace(df)
+
+
+def test_transformerChainDoesNotModifyInput():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 6.0, 8.0]})
+    dfOriginal = df.copy()
+    chain = DataFrameTransformerChain([DFTSkLearnTransformer(StandardScaler()), DFTFromColumnGenerators([ColumnGeneratorSum()]),
+        DFTSkLearnTransformer(StandardScaler(), columns=["sum"])])
+    result = chain.apply(df, fit=True)
+    assert df.equals(dfOriginal)
+    assert list(result.columns) == ["a", "b", "sum"]
+    assert np.allclose(result.values.mean(axis=0), 0)
+
+
+def test_transformerChainDoesNotModifyViewOfInput():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 6.0, 8.0]})
+    dfOriginal = df.copy()
+    scaler1 = DFTSkLearnTransformerRecordingInplace(StandardScaler())
+    scaler2 = DFTSkLearnTransformerRecordingInplace(StandardScaler())
+    result = DataFrameTransformerChain([DFTDropFirstRow(), scaler1, scaler2]).apply(df, fit=True)
+    assert df.equals(dfOriginal)
+    assert not scaler1.appliedInplace and scaler2.appliedInplace
+    assert np.allclose(result.values.mean(axis=0), 0)
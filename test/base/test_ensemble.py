@@ -1,3 +1,21 @@
 def test_ensemble():
     import sensai.ensemble
     assert True
+
+
+def test_ensembleClone():
+    import numpy as np
+    import pandas as pd
+    import sensai
+    from sensai.ensemble import AveragingVectorRegressionModel
+    inputs = pd.DataFrame({"a": np.arange(10.0)})
+    outputs = pd.DataFrame({"y": 2 * inputs["a"]})
+    members = [sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel() for _ in range(2)]
+    model = AveragingVectorRegressionModel(members)
+    model.fit(inputs, outputs)
+    clonedModel = model.clone()
+    assert model.isFitted() and all(m.isFitted() for m in model.models)
+    assert not clonedModel.isFitted()
+    for member, clonedMember in zip(model.models, clonedModel.models):
+        assert clonedMember is not member and not clonedMember.isFitted() and clonedMember.model is None
+        assert clonedMember.modelArgs is not member.modelArgs
@@ -1,4 +1,19 @@
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn.linear_model
+import sklearn.svm
+from sklearn.preprocessing import StandardScaler, MinMaxScaler, PowerTransformer
+
 import sensai
+from sensai import InputOutputData
+from sensai.data_transformation import DFTSkLearnTransformer, DFTRoundFloats
+from sensai.featuregen import FeatureGeneratorTakeColumns
+from sensai.sklearn.sklearn_base import AbstractSkLearnMultiDimVectorRegressionModel
+from sensai.evaluation import VectorRegressionModelEvaluator
+from sensai.evaluation.eval_stats.eval_stats_regression import RegressionMetricMAE
 
 
 def test_RandomForestClassifier(irisClassificationTestCase):
@@ -11,3 +26,98 @@ def test_MLP(irisClassificationTestCase):
     irisClassificationTestCase.testMinAccuracy(mlpBFGS, 0.9)
     mlpAdam = sensai.sklearn.classification.SkLearnMLPVectorClassificationModel(solver="adam").withName("skMLP-adam")
     irisClassificationTestCase.testMinAccuracy(mlpAdam, 0.9)
+
+
+def test_clone(irisDataSet):
+    data = irisDataSet.getInputOutputData()
+    model = sensai.sklearn.classification.SkLearnRandomForestVectorClassificationModel(n_estimators=10)
+    model.fit(data.inputs, data.outputs)
+    clonedModel = model.clone()
+    assert model.isFitted() and model.model is not None
+    assert not clonedModel.isFitted() and clonedModel.model is None
+    assert clonedModel.modelArgs == model.modelArgs and clonedModel.modelArgs is not model.modelArgs
+    clonedModel.fit(data.inputs, data.outputs)
+    assert clonedModel.model is not model.model
+
+
+def test_LinearRegressionMultiOutput():
+    rand = np.random.RandomState(42)
+    inputs = pd.DataFrame(rand.randn(100, 3), columns=["a", "b", "c"])
+    outputs = pd.DataFrame({"y": inputs["a"] * 2 - inputs["b"], "z": inputs["c"] + 1})
+    ev = VectorRegressionModelEvaluator(InputOutputData(inputs, outputs), testFraction=0.2)
+    model = sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel()
+    ev.fitModel(model)
+    evalData = ev.evalModel(model)
+    for predictedVarName in ["y", "z"]:
+        evalStats = evalData.getEvalStats(predictedVarName)
+        assert len(evalStats.y_true) == 20
+        assert evalStats.getAll()["R2"] > 0.99
+    df = evalData.getDataFrame()
+    assert list(df.index) == ["y", "z"]
+    assert df.loc["z", "MAE"] == evalData.getEvalStats("z").getAll()["MAE"]
+    # metrics which are only present for some of the output variables are aligned by name
+    evalData.getEvalStats("y").addMetric(RegressionMetricMAE("MAE2"))
+    df = evalData.getDataFrame()
+    assert df.loc["y", "MAE2"] == df.loc["y", "MAE"]
+    assert np.isnan(df.loc["z", "MAE2"])
+
+
+class SkLearnGenericVectorRegressionModel(AbstractSkLearnMultiDimVectorRegressionModel):
+    def __init__(self, modelConstructor, **modelArgs):
+        super().__init__(modelConstructor, **modelArgs)
+
+
+_poissonRegressorAvailable = hasattr(sklearn.linear_model, "PoissonRegressor")  # scikit-learn >= 0.23
+_minMaxScalerClipAvailable = "clip" in inspect.signature(MinMaxScaler).parameters  # scikit-learn >= 0.24
+
+
+def _createRegressionData():
+    rand = np.random.RandomState(42)
+    inputs = pd.DataFrame(rand.rand(50, 3) * 10 + 5, columns=["a", "b", "c"])
+    outputs = pd.DataFrame({"y": np.exp(0.1 * inputs["a"]) + inputs["b"], "z": inputs["c"] + 1})
+    X = rand.rand(5, 3) * 30
+    return inputs, outputs, X
+
+
+@pytest.mark.parametrize("model", [
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel(),
+    SkLearnGenericVectorRegressionModel(sklearn.linear_model.Ridge),
+    SkLearnGenericVectorRegressionModel(sklearn.svm.SVR, kernel="linear"),
+], ids=lambda m: m.modelConstructor.__name__)
+def test_compileSpecialized(model):
+    inputs, outputs, X = _createRegressionData()
+    if model.modelConstructor is sklearn.svm.SVR:
+        outputs = outputs[["y"]]
+    model.withInputTransformers(DFTSkLearnTransformer(StandardScaler())).withSkLearnInputTransformer(MinMaxScaler())
+    model.fit(inputs, outputs)
+    expected = model.predict(pd.DataFrame(X, columns=inputs.columns)).values
+    fn = model.compileSpecialized()
+    assert fn.__name__ == "predictLinear"
+    assert np.allclose(fn(X), expected)
+
+
+@pytest.mark.parametrize("model", [
+    sensai.sklearn.regression.SkLearnRandomForestVectorRegressionModel(n_estimators=5),
+    pytest.param(SkLearnGenericVectorRegressionModel(sklearn.linear_model.PoissonRegressor) if _poissonRegressorAvailable else None,
+        marks=pytest.mark.skipif(not _poissonRegressorAvailable, reason="requires PoissonRegressor (scikit-learn >= 0.23)")),
+    SkLearnGenericVectorRegressionModel(sklearn.svm.SVR, kernel="rbf"),
+    pytest.param(sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel().withSkLearnInputTransformer(MinMaxScaler(clip=True))
+        if _minMaxScalerClipAvailable else None,
+        marks=pytest.mark.skipif(not _minMaxScalerClipAvailable, reason="requires MinMaxScaler(clip=...) (scikit-learn >= 0.24)")),
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel().withSkLearnInputTransformer(PowerTransformer()),
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel()
+        .withInputTransformers(DFTSkLearnTransformer(StandardScaler(), columns=["a"])),
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel().withTargetTransformer(DFTSkLearnTransformer(StandardScaler())),
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel().withOutputTransformers(DFTRoundFloats()),
+    sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel().withFeatureGenerator(FeatureGeneratorTakeColumns()),
+], ids=["randomForest", "poisson", "svrRbf", "minMaxClip", "powerTransformer", "columnSubset", "targetTransformer",
+    "outputTransformer", "featureGenerator"])
+def test_compileSpecializedFallback(model):
+    inputs, outputs, X = _createRegressionData()
+    if isinstance(model, SkLearnGenericVectorRegressionModel):
+        outputs = outputs[["y"]]
+    model.fit(inputs, outputs)
+    expected = model.predict(pd.DataFrame(X, columns=inputs.columns)).values
+    fn = model.compileSpecialized()
+    assert fn.__name__ == "predictArray"
+    assert np.allclose(fn(X), expected)
@@ -0,0 +1,43 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sensai
+
+
+@pytest.fixture()
+def fittedModel():
+    rand = np.random.RandomState(42)
+    inputs = pd.DataFrame(rand.randn(20, 2), columns=["a", "b"])
+    outputs = pd.DataFrame({"y": inputs["a"] - inputs["b"]})
+    model = sensai.sklearn.regression.SkLearnLinearRegressionVectorRegressionModel()
+    model.fit(inputs, outputs)
+    return model, inputs
+
+
+def test_inputColumnCheckIdentity(fittedModel):
+    model, inputs = fittedModel
+    # the same columns object is accepted without comparing the names
+    model._modelInputVariableNamesTuple = ("x",)
+    model.predict(inputs)
+    with pytest.raises(Exception):
+        model.predict(pd.DataFrame(inputs.values, columns=list(inputs.columns)))
+
+
+def test_inputColumnCheckNames(fittedModel):
+    model, inputs = fittedModel
+    model.predict(pd.DataFrame(inputs.values, columns=list(inputs.columns)))
+    with pytest.raises(Exception):
+        model.predict(inputs[["b", "a"]])
+
+
+def test_inputColumnCheckModelPickledByEarlierVersion(fittedModel):
+    model, inputs = fittedModel
+    del model._modelInputColumns
+    del model._modelInputVariableNamesTuple
+    model = pickle.loads(pickle.dumps(model))
+    model.predict(pd.DataFrame(inputs.values, columns=list(inputs.columns)))
+    with pytest.raises(Exception):
+        model.predict(inputs[["b", "a"]])
@@ -1,5 +1,6 @@
 import logging
 
+import numpy as np
 import pandas as pd
 import pytest
 import sklearn.datasets
@@ -17,7 +18,7 @@ class IrisDataSet:
     def getInputOutputData(cls):
         if cls._iod is None:
             d = sklearn.datasets.load_iris()
-            inputs = pd.DataFrame(d["data"], columns=d["feature_names"])
+            inputs = pd.DataFrame(np.ascontiguousarray(d["data"], dtype=np.float32), columns=d["feature_names"])
             targetNames = d["target_names"]
             outputs = pd.DataFrame({"class": [targetNames[x] for x in d["target"]]})
             cls._iod = InputOutputData(inputs, outputs)